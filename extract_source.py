@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """Download arXiv LaTeX source and extract figures."""
 
+import functools
 import gzip
+import http.client
 import io
+import itertools
+import logging
+import logging.handlers
+import multiprocessing
 import os
 import re
 import shutil
@@ -10,15 +16,49 @@ import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import time
+import urllib.error
 import urllib.request
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    # python-isal's igzip decompresses roughly twice as fast as zlib
+    from isal.igzip import IGzipFile as _GzipFile
+except ImportError:
+    _GzipFile = gzip.GzipFile
+
+log = logging.getLogger("extract_source")
+
 SCRIPT_DIR = Path(__file__).parent
 PAPERS_DIR = SCRIPT_DIR / "papers"
 
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".pdf", ".eps", ".svg", ".gif", ".bmp", ".tiff"}
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".pdf", ".eps", ".svg", ".gif", ".bmp", ".tiff"})
 MAX_FIGURES = 10  # Save at most this many figures
+TEX_HEAD_BYTES = 64 * 1024  # \documentclass is expected within this prefix
+SCAN_WORKERS = 8  # Threads used to list sibling directories concurrently
+READ_BUFFER_SIZE = 128 * 1024  # Buffer size for streaming the e-print download
+GZIP_MAGIC = b"\x1f\x8b"
+TAR_MAGIC = b"ustar"  # POSIX tar headers carry this at offset 257 of the first block
+PDF_MAGIC = b"%PDF-"
+
+# Caps concurrent pdftoppm processes; replaced by a cross-process semaphore in extract_many workers
+_PDFTOPPM_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+# Caps concurrent e-print downloads the same way, so extract_many stays polite to arxiv.org
+MAX_DOWNLOADS = 1
+_DOWNLOAD_SLOTS = threading.BoundedSemaphore(MAX_DOWNLOADS)
+# The paper an extract_many worker is currently extracting, attached to its log records
+_current_arxiv_id: str | None = None
+
+_INPUT_RE = re.compile(r"\\(?:input|include)\{([^}]+)\}")
+_FIG_RE = re.compile(r"\\begin\{figure\*?\}(.*?)\\end\{figure\*?\}", re.DOTALL)
+_IMG_RE = re.compile(r"\\includegraphics(?:\[.*?\])?\{([^}]+)\}")
+_CAP_RE = re.compile(r"\\caption(?:\[.*?\])?\{(.+?)\}", re.DOTALL)
+_CAP_CLEAN_RE = re.compile(r"\\[a-zA-Z]+\{([^}]*)\}")
+_DOCCLASS_MARKER = b"\\documentclass"
+_BRACE_TABLE = str.maketrans("", "", "{}")
 
 
 def convert_pdf_to_png(pdf_path: Path, png_path: Path, dpi: int = 150) -> bool:
@@ -26,106 +66,279 @@ def convert_pdf_to_png(pdf_path: Path, png_path: Path, dpi: int = 150) -> bool:
     try:
         # pdftoppm outputs {prefix}-{page}.png, we use -singlefile for just one page
         prefix = str(png_path.with_suffix(""))
-        subprocess.run(
-            ["pdftoppm", "-png", "-r", str(dpi), "-singlefile", str(pdf_path), prefix],
-            check=True,
-            capture_output=True,
-            timeout=30,
-        )
+        with _PDFTOPPM_SLOTS:
+            subprocess.run(
+                ["pdftoppm", "-png", "-r", str(dpi), "-singlefile", str(pdf_path), prefix],
+                check=True,
+                capture_output=True,
+                timeout=30,
+            )
         return png_path.exists()
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
 
-def download_source(arxiv_id: str) -> bytes:
-    """Download arXiv e-print source."""
-    url = f"https://arxiv.org/e-print/{arxiv_id}"
-    req = urllib.request.Request(url, headers={"User-Agent": "arxiv-scout/1.0"})
-    for attempt in range(3):
+def convert_pdfs_to_png(jobs: list[tuple[Path, Path]], dpi: int = 150) -> list[bool]:
+    """Convert several (pdf_path, png_path) jobs, batching them through one pdftoppm run."""
+    if len(jobs) > 1 and _convert_merged_pdfs(jobs, dpi):
+        return [True] * len(jobs)
+    return [convert_pdf_to_png(pdf_path, png_path, dpi) for pdf_path, png_path in jobs]
+
+
+def _convert_merged_pdfs(jobs: list[tuple[Path, Path]], dpi: int) -> bool:
+    """Rasterize all jobs through one merged PDF. Returns False if anything does not line up."""
+    with tempfile.TemporaryDirectory() as tmp:
+        merged = os.path.join(tmp, "merged.pdf")
+        prefix = os.path.join(tmp, "page")
         try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                return resp.read()
-        except Exception as e:
-            if attempt == 2:
-                raise
-            wait = 5 * (attempt + 1)
-            print(f"  Attempt {attempt + 1} failed ({e}), retrying in {wait}s ...")
-            time.sleep(wait)
-    raise RuntimeError("unreachable")
+            with _PDFTOPPM_SLOTS:
+                subprocess.run(
+                    ["pdfunite", *(str(pdf_path) for pdf_path, _ in jobs), merged],
+                    check=True,
+                    capture_output=True,
+                    timeout=30,
+                )
+                # Render one page more than expected so a multi-page input is detectable
+                subprocess.run(
+                    ["pdftoppm", "-png", "-r", str(dpi), "-l", str(len(jobs) + 1), merged, prefix],
+                    check=True,
+                    capture_output=True,
+                    timeout=30 * len(jobs),
+                )
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            return False
+
+        # pdftoppm names pages {prefix}-{n}.png, zero-padded to the page count width
+        pages = sorted(Path(tmp).glob("page-*.png"), key=lambda p: int(p.stem.rpartition("-")[2]))
+        if len(pages) != len(jobs):
+            return False
+        for page, (_, png_path) in zip(pages, jobs):
+            shutil.move(page, png_path)
+    return True
+
+
+def _skip_unsafe_member(member: tarfile.TarInfo, dest_path: str) -> tarfile.TarInfo | None:
+    """Extraction filter: apply tarfile's "data" filter, but skip rejected members instead of aborting."""
+    try:
+        return tarfile.data_filter(member, dest_path)
+    except tarfile.FilterError:
+        return None
 
 
 def extract_tar(data: bytes, dest: Path) -> None:
-    """Extract a (possibly gzipped) tar archive."""
-    try:
-        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
-            tar.extractall(dest, filter="data")
-            return
-    except (tarfile.TarError, gzip.BadGzipFile):
-        pass
+    """Extract a (possibly gzipped) tar archive, or save a bare .tex/PDF payload."""
+    if data[:2] == GZIP_MAGIC:
+        with _GzipFile(fileobj=io.BytesIO(data), mode="rb") as gz:
+            _extract_gzip(gz, dest)
+        return
+
+    if data[257:262] == TAR_MAGIC:
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:") as tar:
+            tar.extractall(dest, filter=_skip_unsafe_member)
+        return
+
+    if data[:5] == PDF_MAGIC:
+        (dest / "paper.pdf").write_bytes(data)
+        return
 
+    # Ambiguous: possibly a pre-POSIX or bzip2/xz tar
     try:
         with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as tar:
-            tar.extractall(dest, filter="data")
+            tar.extractall(dest, filter=_skip_unsafe_member)
             return
     except tarfile.TarError:
         pass
 
-    # Maybe it's a single gzipped .tex file
-    try:
-        decompressed = gzip.decompress(data)
-        (dest / "main.tex").write_bytes(decompressed)
+    # Raw single tex
+    (dest / "main.tex").write_bytes(data)
+
+
+def _extract_gzip(gz: gzip.GzipFile, dest: Path) -> None:
+    """Extract a gzip stream holding either a tar archive or a single file."""
+    if gz.peek(512)[257:262] == TAR_MAGIC:
+        with tarfile.open(fileobj=gz, mode="r|") as tar:
+            tar.extractall(dest, filter=_skip_unsafe_member)
         return
-    except gzip.BadGzipFile:
-        pass
+    # Single gzipped .tex file
+    (dest / "main.tex").write_bytes(gz.read())
 
-    # Raw file (PDF or single tex)
-    if data[:5] == b"%PDF-":
-        (dest / "paper.pdf").write_bytes(data)
-    else:
-        (dest / "main.tex").write_bytes(data)
 
+def extract_stream(stream: io.BufferedReader, dest: Path) -> None:
+    """Extract an e-print source from a buffered stream, unpacking gzipped tarballs on the fly."""
+    if stream.peek(len(GZIP_MAGIC))[:len(GZIP_MAGIC)] != GZIP_MAGIC:
+        extract_tar(stream.read(), dest)
+        return
+
+    with _GzipFile(fileobj=stream, mode="rb") as gz:
+        _extract_gzip(gz, dest)
 
-def find_main_tex(src_dir: Path) -> Path | None:
-    """Find the main .tex file (the one containing \\documentclass)."""
-    for f in src_dir.rglob("*.tex"):
+
+def _clear_dir(path: Path) -> None:
+    """Remove everything inside path, keeping path itself."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def download_and_extract(arxiv_id: str, dest: Path) -> None:
+    """Download arXiv e-print source and extract it into dest while streaming."""
+    url = f"https://arxiv.org/e-print/{arxiv_id}"
+    req = urllib.request.Request(url, headers={"User-Agent": "arxiv-scout/1.0"})
+    for attempt in range(3):
         try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            if re.search(r"\\documentclass", content):
+            with _DOWNLOAD_SLOTS, urllib.request.urlopen(req, timeout=60) as resp:
+                stream = io.BufferedReader(resp, buffer_size=READ_BUFFER_SIZE)
+                try:
+                    extract_stream(stream, dest)
+                    # Drain tar padding so a short body shows up in resp.length
+                    while stream.read(READ_BUFFER_SIZE):
+                        pass
+                except (EOFError, tarfile.ReadError):
+                    # An early close makes readinto() return 0 instead of raising
+                    if not resp.length:
+                        raise
+                    raise http.client.IncompleteRead(b"", resp.length) from None
+                if resp.length:
+                    raise http.client.IncompleteRead(b"", resp.length)
+                return
+        # Only transport errors are retried; a malformed archive fails the same way every time
+        except (urllib.error.URLError, TimeoutError, ConnectionError, http.client.IncompleteRead) as e:
+            if attempt == 2:
+                raise
+            wait = 5 * (attempt + 1)
+            log.warning("  Attempt %d failed (%s), retrying in %ds ...", attempt + 1, e, wait)
+            _clear_dir(dest)
+            time.sleep(wait)
+    raise RuntimeError("unreachable")
+
+
+def _scan_one(dir_path: str, prefix: str) -> tuple[list[tuple[str, str]], dict[str, Path], list[Path]]:
+    """List a single directory. Returns (subdirs, images, tex_files) found directly in it."""
+    subdirs: list[tuple[str, str]] = []
+    images: dict[str, Path] = {}
+    tex_files: list[Path] = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, f"{prefix}{entry.name}/"))
+            elif entry.name.endswith(".tex"):
+                tex_files.append(Path(entry.path))
+            else:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in IMAGE_EXTENSIONS and entry.is_file():
+                    images[prefix + stem] = Path(entry.path)
+    return subdirs, images, tex_files
+
+
+def scan_source_tree(src_dir: Path) -> tuple[dict[str, Path], list[Path]]:
+    """Walk src_dir once breadth-first, collecting image files and .tex files. Returns (images, tex_files)."""
+    images: dict[str, Path] = {}
+    tex_files: list[Path] = []
+    # Each wave item pairs a directory with its key prefix relative to src_dir
+    wave = [(os.fspath(src_dir), "")]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        while wave:
+            if len(wave) == 1:
+                results = [_scan_one(*wave[0])]
+            else:
+                results = ex.map(_scan_one, *zip(*wave))
+            wave = []
+            for subdirs, dir_images, dir_tex_files in results:
+                wave.extend(subdirs)
+                images.update(dir_images)
+                tex_files.extend(dir_tex_files)
+    return images, tex_files
+
+
+def _read_tex(tex_path: Path, tex_cache: dict[Path, str] | None = None) -> str:
+    """Read a .tex file as text, reusing and filling tex_cache when given."""
+    if tex_cache is not None and (content := tex_cache.get(tex_path)) is not None:
+        return content
+    content = tex_path.read_text(encoding="utf-8", errors="ignore")
+    if tex_cache is not None:
+        tex_cache[tex_path] = content
+    return content
+
+
+def _has_documentclass(tex_path: Path, tex_cache: dict[Path, str] | None = None) -> bool:
+    """Check the raw head of a .tex file for \\documentclass, caching the full text on a match."""
+    try:
+        with open(tex_path, "rb") as f:
+            head = f.read(TEX_HEAD_BYTES)
+            if _DOCCLASS_MARKER not in head:
+                return False
+            if tex_cache is not None:
+                data = head + f.read()
+                # Same newline translation as Path.read_text
+                text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+                tex_cache[tex_path] = text
+    except OSError:
+        return False
+    return True
+
+
+def find_main_tex(
+    src_dir: Path,
+    tex_files: list[Path] | None = None,
+    tex_cache: dict[Path, str] | None = None,
+) -> Path | None:
+    """Find the main .tex file (the one containing \\documentclass), probing shallower files first."""
+    if tex_files is not None:
+        for f in tex_files:
+            if _has_documentclass(f, tex_cache):
                 return f
-        except Exception:
-            continue
+        return None
+
+    wave = [(os.fspath(src_dir), "")]
+    while wave:
+        next_wave = []
+        for dir_path, prefix in wave:
+            subdirs, _, dir_tex_files = _scan_one(dir_path, prefix)
+            for f in dir_tex_files:
+                if _has_documentclass(f, tex_cache):
+                    return f
+            next_wave.extend(subdirs)
+        wave = next_wave
     return None
 
 
-def resolve_tex_content(tex_path: Path, src_dir: Path, visited: set[str] | None = None) -> str:
+def resolve_tex_content(
+    tex_path: Path,
+    src_dir: Path,
+    visited: set[tuple[int, int]] | None = None,
+    tex_cache: dict[Path, str] | None = None,
+) -> str:
     """Recursively resolve \\input/\\include directives to build full document in order."""
     if visited is None:
         visited = set()
 
-    resolved = str(tex_path.resolve())
-    if resolved in visited:
+    # Identify files by (device, inode): one stat() instead of a realpath() walk,
+    # and symlinked paths to the same file (e.g. sub -> .) still count as visited
+    try:
+        st = os.stat(tex_path)
+    except OSError:
         return ""
-    visited.add(resolved)
+    file_id = (st.st_dev, st.st_ino)
+    if file_id in visited:
+        return ""
+    visited.add(file_id)
 
     try:
-        content = tex_path.read_text(encoding="utf-8", errors="ignore")
+        content = _read_tex(tex_path, tex_cache)
     except Exception:
         return ""
 
-    input_pattern = re.compile(r"\\(?:input|include)\{([^}]+)\}")
-
-    result = []
-    last_end = 0
-    for match in input_pattern.finditer(content):
-        result.append(content[last_end:match.start()])
-        ref = match.group(1)
+    def _inline(match: re.Match) -> str:
         # Resolve the referenced file
-        child = _find_tex_file(ref, tex_path.parent, src_dir)
+        child = _find_tex_file(match.group(1), tex_path.parent, src_dir)
         if child and child.exists():
-            result.append(resolve_tex_content(child, src_dir, visited))
-        last_end = match.end()
-    result.append(content[last_end:])
-    return "".join(result)
+            return resolve_tex_content(child, src_dir, visited, tex_cache)
+        return ""
+
+    return _INPUT_RE.sub(_inline, content)
 
 
 def _find_tex_file(ref: str, parent_dir: Path, src_dir: Path) -> Path | None:
@@ -144,54 +357,47 @@ def _find_tex_file(ref: str, parent_dir: Path, src_dir: Path) -> Path | None:
 
 def find_image_files(src_dir: Path) -> dict[str, Path]:
     """Find all image files, keyed by stem (relative path without extension)."""
-    images: dict[str, Path] = {}
-    for f in src_dir.rglob("*"):
-        if f.suffix.lower() in IMAGE_EXTENSIONS and f.is_file():
-            rel = f.relative_to(src_dir)
-            key = str(rel.with_suffix("")).replace("\\", "/")
-            images[key] = f
-    return images
+    return scan_source_tree(src_dir)[0]
 
 
-def parse_figures_from_tex(tex_content: str) -> list[dict]:
-    """Parse \\begin{figure} environments to find figure numbers and their image paths."""
-    figures = []
-    fig_num = 0
-
-    fig_pattern = re.compile(
-        r"\\begin\{figure\*?\}(.*?)\\end\{figure\*?\}",
-        re.DOTALL,
-    )
-
-    for match in fig_pattern.finditer(tex_content):
-        fig_num += 1
+def iter_figures_from_tex(tex_content: str) -> Iterator[dict]:
+    """Lazily parse \\begin{figure} environments in document order."""
+    for fig_num, match in enumerate(_FIG_RE.finditer(tex_content), start=1):
         body = match.group(1)
 
         # Find includegraphics paths
-        img_pattern = re.compile(r"\\includegraphics(?:\[.*?\])?\{([^}]+)\}")
-        img_paths = img_pattern.findall(body)
+        img_paths = _IMG_RE.findall(body)
 
         # Find caption
-        cap_pattern = re.compile(r"\\caption(?:\[.*?\])?\{(.+?)\}", re.DOTALL)
-        cap_match = cap_pattern.search(body)
+        cap_match = _CAP_RE.search(body)
         caption = cap_match.group(1).strip() if cap_match else ""
         # Clean up LaTeX commands in caption
-        caption = re.sub(r"\\[a-zA-Z]+\{([^}]*)\}", r"\1", caption)
-        caption = re.sub(r"[{}]", "", caption)
+        caption = _CAP_CLEAN_RE.sub(r"\1", caption).translate(_BRACE_TABLE)
         caption = " ".join(caption.split())
         if len(caption) > 120:
             caption = caption[:117] + "..."
 
-        figures.append({
+        yield {
             "number": fig_num,
             "image_paths": img_paths,
             "caption": caption,
-        })
+        }
 
-    return figures
+
+def parse_figures_from_tex(tex_content: str, limit: int | None = None) -> list[dict]:
+    """Parse \\begin{figure} environments to find figure numbers and their image paths."""
+    return list(itertools.islice(iter_figures_from_tex(tex_content), limit))
 
 
-def resolve_image(img_ref: str, images: dict[str, Path]) -> Path | None:
+def index_basenames(images: dict[str, Path]) -> dict[str, Path]:
+    """Map each image's basename (without extension) to its first occurrence in images."""
+    basenames: dict[str, Path] = {}
+    for key, path in images.items():
+        basenames.setdefault(os.path.basename(key), path)
+    return basenames
+
+
+def resolve_image(img_ref: str, images: dict[str, Path], basenames: dict[str, Path] | None = None) -> Path | None:
     """Resolve a LaTeX image reference to an actual file."""
     # Try exact match first
     if img_ref in images:
@@ -210,13 +416,41 @@ def resolve_image(img_ref: str, images: dict[str, Path]) -> Path | None:
             return images[key_no_ext]
 
     # Basename match
+    if basenames is None:
+        basenames = index_basenames(images)
     base = os.path.basename(clean)
     base_no_ext = base.rsplit(".", 1)[0] if "." in base else base
-    for key, path in images.items():
-        if os.path.basename(key) == base_no_ext:
-            return path
+    return basenames.get(base_no_ext)
 
-    return None
+
+def make_image_resolver(images: dict[str, Path]) -> Callable[[str], Path | None]:
+    """Return a memoized resolve_image bound to images, sharing one basename index."""
+    basenames = index_basenames(images)
+
+    @functools.lru_cache(maxsize=256)
+    def resolve(img_ref: str) -> Path | None:
+        return resolve_image(img_ref, images, basenames)
+
+    return resolve
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst with metadata, like shutil.copy2, but via os.copy_file_range where possible."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break  # Some filesystems silently refuse; copy the usual way instead
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
 
 
 def extract_figures(arxiv_id: str, published_date: str, output_base: Path | None = None) -> dict:
@@ -236,81 +470,98 @@ def extract_figures(arxiv_id: str, published_date: str, output_base: Path | None
     out_dir = output_base / published_date / clean_id
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"Downloading source for {arxiv_id} ...")
-    data = download_source(arxiv_id)
-    print(f"  Downloaded {len(data)} bytes")
-
-    # Extract to temp directory
+    # Download and extract to temp directory
     with tempfile.TemporaryDirectory() as tmp:
         tmp_path = Path(tmp)
-        extract_tar(data, tmp_path)
-
-        # Find main tex and image files
-        main_tex = find_main_tex(tmp_path)
-        images = find_image_files(tmp_path)
-
-        if main_tex:
-            print(f"  Main TeX: {main_tex.relative_to(tmp_path)}")
-            tex_content = resolve_tex_content(main_tex, tmp_path)
-        else:
+        log.info("Downloading source for %s ...", arxiv_id)
+        download_and_extract(arxiv_id, tmp_path)
+
+        # Walk the whole tree for images in the background while the main tex,
+        # which is usually at the root, is found and resolved on this thread
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            scan = prefetch.submit(scan_source_tree, tmp_path)
+            # Each .tex file is read and decoded at most once
+            tex_cache: dict[Path, str] = {}
+            main_tex = find_main_tex(tmp_path, tex_cache=tex_cache)
+            if main_tex:
+                log.info("  Main TeX: %s", main_tex.relative_to(tmp_path))
+                tex_content = resolve_tex_content(main_tex, tmp_path, tex_cache=tex_cache)
+            images, tex_files = scan.result()
+
+        if not main_tex:
             # Fallback: concatenate all .tex files
-            tex_files = sorted(tmp_path.rglob("*.tex"))
-            print(f"  No main TeX found, concatenating {len(tex_files)} .tex files")
-            tex_content = ""
+            tex_files = sorted(tex_files)
+            log.info("  No main TeX found, concatenating %d .tex files", len(tex_files))
+            parts = []
             for tf in tex_files:
                 try:
-                    tex_content += tf.read_text(encoding="utf-8", errors="ignore") + "\n"
+                    parts.append(_read_tex(tf, tex_cache))
                 except Exception:
                     continue
-
-        print(f"  Found {len(images)} image files")
-
-        # Parse figures in document order
-        figures = parse_figures_from_tex(tex_content)
-        print(f"  Found {len(figures)} figure environments in LaTeX")
-
-        saved_figures = []
-        for fig in figures:
-            if len(saved_figures) >= MAX_FIGURES:
-                print(f"  Reached max figures ({MAX_FIGURES}), stopping extraction")
+            tex_content = "\n".join(parts)
+
+        log.info("  Found %d image files", len(images))
+
+        # Pick the first usable image of each figure environment. Figures are
+        # parsed lazily, so environments past MAX_FIGURES are never processed.
+        resolve = make_image_resolver(images)
+        selected = []
+        parsed = 0
+        for fig in iter_figures_from_tex(tex_content):
+            if len(selected) >= MAX_FIGURES:
+                log.info("  Reached max figures (%d), stopping extraction", MAX_FIGURES)
                 break
+            parsed += 1
 
             for img_ref in fig["image_paths"]:
-                resolved = resolve_image(img_ref, images)
+                resolved = resolve(img_ref)
                 if resolved is None:
-                    print(f"  WARNING: Could not resolve image: {img_ref}")
+                    log.warning("  WARNING: Could not resolve image: %s", img_ref)
                     continue
 
                 ext = resolved.suffix.lower()
                 if ext == ".eps":
-                    print(f"  Skipping EPS file: {img_ref}")
+                    log.info("  Skipping EPS file: %s", img_ref)
                     continue
 
-                # Convert PDF figures to PNG for markdown embedding
-                if ext == ".pdf":
-                    dest_name = f"figure{fig['number']}.png"
-                    dest_path = out_dir / dest_name
-                    if convert_pdf_to_png(resolved, dest_path):
-                        print(f"  Saved {dest_name} (converted from PDF, {dest_path.stat().st_size} bytes)")
-                    else:
-                        # Fallback: save as PDF
-                        dest_name = f"figure{fig['number']}.pdf"
-                        dest_path = out_dir / dest_name
-                        shutil.copy2(resolved, dest_path)
-                        print(f"  Saved {dest_name} (PDF, pdftoppm conversion failed)")
+                selected.append((fig, resolved, ext))
+                break  # Take first image per figure environment
+
+        log.info("  Parsed %d figure environments in LaTeX", parsed)
+
+        # Convert PDF figures to PNG for markdown embedding, all in one batch
+        pdf_jobs = [
+            (resolved, out_dir / f"figure{fig['number']}.png")
+            for fig, resolved, ext in selected
+            if ext == ".pdf"
+        ]
+        converted = dict(zip((png_path for _, png_path in pdf_jobs), convert_pdfs_to_png(pdf_jobs)))
+
+        saved_figures = []
+        for fig, resolved, ext in selected:
+            if ext == ".pdf":
+                dest_name = f"figure{fig['number']}.png"
+                dest_path = out_dir / dest_name
+                if converted[dest_path]:
+                    log.info("  Saved %s (converted from PDF, %d bytes)", dest_name, dest_path.stat().st_size)
                 else:
-                    dest_name = f"figure{fig['number']}{ext}"
+                    # Fallback: save as PDF
+                    dest_name = f"figure{fig['number']}.pdf"
                     dest_path = out_dir / dest_name
-                    shutil.copy2(resolved, dest_path)
-                    print(f"  Saved {dest_name} ({resolved.stat().st_size} bytes)")
-
-                saved_figures.append({
-                    "number": fig["number"],
-                    "caption": fig["caption"],
-                    "filename": dest_name,
-                    "saved_path": str(dest_path),
-                })
-                break  # Take first image per figure environment
+                    _fast_copy(resolved, dest_path)
+                    log.info("  Saved %s (PDF, pdftoppm conversion failed)", dest_name)
+            else:
+                dest_name = f"figure{fig['number']}{ext}"
+                dest_path = out_dir / dest_name
+                _fast_copy(resolved, dest_path)
+                log.info("  Saved %s (%d bytes)", dest_name, resolved.stat().st_size)
+
+            saved_figures.append({
+                "number": fig["number"],
+                "caption": fig["caption"],
+                "filename": dest_name,
+                "saved_path": str(dest_path),
+            })
 
     return {
         "tex_content": tex_content,
@@ -320,21 +571,92 @@ def extract_figures(arxiv_id: str, published_date: str, output_base: Path | None
     }
 
 
+def _tag_arxiv_id(record: logging.LogRecord) -> bool:
+    """Logging filter for extract_many workers: tag records with the paper being extracted."""
+    record.arxiv_id = _current_arxiv_id
+    return True
+
+
+def _init_worker(pdftoppm_slots, download_slots, log_queue, log_level: int) -> None:
+    """Set up an extract_many worker process: shared pdftoppm/download limits and queued logging."""
+    global _PDFTOPPM_SLOTS, _DOWNLOAD_SLOTS
+    _PDFTOPPM_SLOTS = pdftoppm_slots
+    _DOWNLOAD_SLOTS = download_slots
+    # Hand records to the parent instead of writing to stdout from every worker
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.addFilter(_tag_arxiv_id)
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(log_level)
+
+
+def _extract_one(job: tuple[str, str], output_base: Path | None = None) -> dict | None:
+    """Run extract_figures for one job, logging failures instead of raising them."""
+    global _current_arxiv_id
+    arxiv_id, published_date = job
+    _current_arxiv_id = arxiv_id
+    try:
+        return extract_figures(arxiv_id, published_date, output_base)
+    except Exception:
+        log.exception("  ERROR: Extraction of %s failed", arxiv_id)
+        return None
+
+
+def extract_many(
+    jobs: list[tuple[str, str]],
+    workers: int = 8,
+    output_base: Path | None = None,
+) -> list[dict | None]:
+    """Run extract_figures for many (arxiv_id, published_date) pairs in parallel; failed papers get None."""
+    pdftoppm_slots = multiprocessing.BoundedSemaphore(os.cpu_count() or 1)
+    download_slots = multiprocessing.BoundedSemaphore(MAX_DOWNLOADS)
+    log_queue = multiprocessing.Queue()
+    root = logging.getLogger()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(pdftoppm_slots, download_slots, log_queue, root.getEffectiveLevel()),
+        ) as ex:
+            return list(ex.map(functools.partial(_extract_one, output_base=output_base), jobs))
+    finally:
+        listener.stop()
+
+
 def main() -> None:
-    if len(sys.argv) < 3:
-        print("Usage: extract_source.py <arxiv_id> <published_date>")
+    args = sys.argv[1:]
+    if len(args) < 2 or len(args) % 2:
+        print("Usage: extract_source.py <arxiv_id> <published_date> [<arxiv_id> <published_date> ...]")
         print("Example: extract_source.py 2602.14486 2026-02-16")
         sys.exit(1)
 
-    arxiv_id = sys.argv[1]
-    published_date = sys.argv[2]
+    jobs = list(zip(args[::2], args[1::2]))
+    handler = logging.StreamHandler(sys.stdout)
+    if len(jobs) > 1:
+        # Lines from parallel workers interleave, so say which paper each belongs to
+        handler.setFormatter(logging.Formatter("[%(arxiv_id)s] %(message)s", defaults={"arxiv_id": "-"}))
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[handler])
+    if len(jobs) == 1:
+        results = [_extract_one(jobs[0])]
+    else:
+        results = extract_many(jobs)
 
-    result = extract_figures(arxiv_id, published_date)
-    print(f"\nOutput directory: {result['output_dir']}")
-    print(f"TeX content length: {len(result['tex_content'])} chars")
-    print(f"Figures saved: {len(result['figures'])}")
-    for fig in result["figures"]:
-        print(f"  Figure {fig['number']}: {fig['filename']} - {fig['caption'][:80]}")
+    failed = []
+    for (arxiv_id, _), result in zip(jobs, results):
+        if result is None:
+            failed.append(arxiv_id)
+            continue
+        print(f"\nOutput directory: {result['output_dir']}")
+        print(f"TeX content length: {len(result['tex_content'])} chars")
+        print(f"Figures saved: {len(result['figures'])}")
+        for fig in result["figures"]:
+            print(f"  Figure {fig['number']}: {fig['filename']} - {fig['caption'][:80]}")
+
+    if failed:
+        print(f"\nFailed: {' '.join(failed)}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
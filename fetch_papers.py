@@ -3,6 +3,7 @@
 
 import argparse
 import csv
+import io
 import os
 import sys
 import time
@@ -18,18 +19,22 @@ FIELDNAMES = ["arxiv_id", "published", "title", "abstract", "authors", "affiliat
 
 CATEGORY = "cs.AI"
 MAX_RESULTS_PER_REQUEST = 200
-REQUEST_INTERVAL = 3  # seconds between API calls
+REQUEST_INTERVAL = 3  # seconds between the starts of consecutive API calls
 
 NS = {
     "atom": "http://www.w3.org/2005/Atom",
     "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
     "arxiv": "http://arxiv.org/schemas/atom",
 }
+ENTRY_TAG = f"{{{NS['atom']}}}entry"
+TOTAL_RESULTS_TAG = f"{{{NS['opensearch']}}}totalResults"
 
 
 MAX_RETRIES = 5
 RETRY_BASE_WAIT = 10  # seconds, doubles each retry
 
+_last_request_start = float("-inf")  # time.monotonic() when the latest API request (or retry) began
+
 
 def fetch_page(query: str, start: int, max_results: int) -> bytes:
     """Single paginated request to arXiv API with exponential backoff."""
@@ -42,8 +47,10 @@ def fetch_page(query: str, start: int, max_results: int) -> bytes:
     })
     url = f"{ARXIV_API_URL}?{params}"
     req = urllib.request.Request(url, headers={"User-Agent": "arxiv-scout/1.0"})
+    global _last_request_start
     for attempt in range(1, MAX_RETRIES + 1):
         try:
+            _last_request_start = time.monotonic()
             with urllib.request.urlopen(req, timeout=60) as resp:
                 return resp.read()
         except (urllib.error.URLError, TimeoutError) as e:
@@ -55,40 +62,54 @@ def fetch_page(query: str, start: int, max_results: int) -> bytes:
     raise RuntimeError("unreachable")
 
 
+def parse_entry(entry: ET.Element) -> dict | None:
+    """Convert one Atom <entry> into a CSV row. Returns None for non-paper entries."""
+    raw_id = entry.findtext("atom:id", "", NS)
+    if "/abs/" not in raw_id:
+        return None  # skip feed-level metadata entries
+
+    arxiv_id = raw_id.split("/abs/")[-1]
+    published = entry.findtext("atom:published", "", NS)
+    title = " ".join(entry.findtext("atom:title", "", NS).split())
+    abstract = " ".join(entry.findtext("atom:summary", "", NS).split())
+
+    authors = []
+    affiliations = []
+    for author in entry.findall("atom:author", NS):
+        name = author.findtext("atom:name", "", NS).strip()
+        if name:
+            authors.append(name)
+        affs = [a.text.strip() for a in author.findall("arxiv:affiliation", NS) if a.text]
+        affiliations.append("; ".join(affs) if affs else "")
+
+    return {
+        "arxiv_id": arxiv_id,
+        "published": published,
+        "title": title,
+        "abstract": abstract,
+        "authors": " | ".join(authors),
+        "affiliations": " | ".join(affiliations),
+        "url": raw_id,
+    }
+
+
 def parse_entries(xml_data: bytes) -> tuple[list[dict], int]:
     """Parse Atom XML. Returns (entries, totalResults)."""
-    root = ET.fromstring(xml_data)
-    total = int(root.findtext("opensearch:totalResults", "0", NS))
-
+    total = 0
     entries = []
-    for entry in root.findall("atom:entry", NS):
-        raw_id = entry.findtext("atom:id", "", NS)
-        if "/abs/" not in raw_id:
-            continue  # skip feed-level metadata entries
-
-        arxiv_id = raw_id.split("/abs/")[-1]
-        published = entry.findtext("atom:published", "", NS)
-        title = " ".join(entry.findtext("atom:title", "", NS).split())
-        abstract = " ".join(entry.findtext("atom:summary", "", NS).split())
-
-        authors = []
-        affiliations = []
-        for author in entry.findall("atom:author", NS):
-            name = author.findtext("atom:name", "", NS).strip()
-            if name:
-                authors.append(name)
-            affs = [a.text.strip() for a in author.findall("arxiv:affiliation", NS) if a.text]
-            affiliations.append("; ".join(affs) if affs else "")
-
-        entries.append({
-            "arxiv_id": arxiv_id,
-            "published": published,
-            "title": title,
-            "abstract": abstract,
-            "authors": " | ".join(authors),
-            "affiliations": " | ".join(affiliations),
-            "url": raw_id,
-        })
+    root = None
+    # Parse incrementally and detach each <entry> from <feed> once converted
+    for event, elem in ET.iterparse(io.BytesIO(xml_data), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+        elif elem.tag == ENTRY_TAG:
+            entry = parse_entry(elem)
+            if entry is not None:
+                entries.append(entry)
+            root.remove(elem)
+        elif elem.tag == TOTAL_RESULTS_TAG:
+            total = int(elem.text or 0)
     return entries, total
 
 
@@ -103,6 +124,10 @@ def fetch_all(target_date: date) -> list[dict]:
     start = 0
 
     while True:
+        # Space request starts REQUEST_INTERVAL apart without adding the response time on top
+        delay = _last_request_start + REQUEST_INTERVAL - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         print(f"  Querying arXiv API (start={start}) ...")
         xml_data = fetch_page(query, start, MAX_RESULTS_PER_REQUEST)
         entries, total = parse_entries(xml_data)
@@ -113,7 +138,6 @@ def fetch_all(target_date: date) -> list[dict]:
         if start + MAX_RESULTS_PER_REQUEST >= total or not entries:
             break
         start += MAX_RESULTS_PER_REQUEST
-        time.sleep(REQUEST_INTERVAL)
 
     return all_entries
 
@@ -123,10 +147,14 @@ def load_existing_ids(path: str) -> set[str]:
     ids: set[str] = set()
     if not os.path.exists(path):
         return ids
-    with open(path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            ids.add(row["arxiv_id"])
+    with open(path, encoding="utf-8", newline="") as f:
+        # Only arxiv_id is needed, so skip building a dict per row
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return ids
+        col = header.index("arxiv_id")
+        ids.update(row[col] for row in reader if row)
     return ids
 
 